@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Shared keep-alive HTTP connection pool for the pipeline scripts (stdlib only)."""
+
+from __future__ import annotations
+
+import email.message
+import http.client
+import threading
+from urllib.parse import urlsplit
+
+
+class ConnectionPool:
+    """Keep-alive http.client connections keyed by origin, safe to share across worker threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+
+    def _acquire(self, scheme: str, host: str, port: int, timeout: float) -> http.client.HTTPConnection:
+        with self._lock:
+            idle = self._idle.get((scheme, host, port))
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                return conn
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return conn_cls(host, port, timeout=timeout)
+
+    def _release(self, scheme: str, host: str, port: int, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault((scheme, host, port), []).append(conn)
+
+    def request(
+        self, method: str, url: str, headers: dict[str, str], body: bytes | None, timeout: float
+    ) -> tuple[int, bytes, email.message.Message]:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        # A pooled connection may have gone stale between calls; retry once on a fresh one.
+        for attempt in (1, 2):
+            conn = self._acquire(scheme, host, port, timeout)
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                response = conn.getresponse()
+                payload = response.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if attempt == 1:
+                    continue
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(scheme, host, port, conn)
+            return response.status, payload, response.headers
+        raise RuntimeError("unreachable")
+
+
+# One pool per process so every script run amortizes TCP/TLS setup across all
+# of its requests, whichever script imports it.
+SHARED_POOL = ConnectionPool()
@@ -4,18 +4,117 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
+import heapq
+import http.client
 import json
 import os
+import random
 import sys
 import time
-import urllib.error
-import urllib.request
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from http_pool import SHARED_POOL  # noqa: E402
+
+try:  # optional: streams events.json instead of materializing the whole document
+    import ijson
+except ImportError:
+    ijson = None
+
+try:  # optional: faster JSON encode/decode; stdlib json remains the fallback
+    import orjson
+except ImportError:
+    orjson = None
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 EVENTS_PATH = REPO_ROOT / "data" / "derived" / "events.json"
 DEFAULT_OUTPUT = REPO_ROOT / "data" / "eval" / "llm_event_refinement_review.json"
+DEFAULT_CACHE_DIR = REPO_ROOT / "data" / "cache" / "llm_event_review"
+
+
+OK_STATUSES = frozenset({"ok", "ok_cached", "ok_batch", "dry_run"})
+
+
+def json_loads(raw: str | bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def dumps_row(row: dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(row).decode("utf-8")
+    return json.dumps(row, separators=(",", ":"))
+
+
+class RowSink:
+    """Streams completed rows to a JSONL sidecar in event order.
+
+    Rows may arrive out of order from the concurrent pipeline; a small reorder
+    buffer (bounded by the in-flight window) flushes the contiguous prefix, so
+    memory stays O(concurrency) instead of O(rows). The partial file also makes
+    interrupted runs recoverable by hand.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._handle = path.open("w", encoding="utf-8")
+        self._pending: dict[int, dict[str, Any]] = {}
+        self._next_index = 1
+        self.count = 0
+        self.ok = 0
+        self.error = 0
+
+    def _write(self, row: dict[str, Any]) -> None:
+        self._handle.write(dumps_row(row) + "\n")
+        self.count += 1
+        status = row.get("status")
+        if status in OK_STATUSES:
+            self.ok += 1
+        elif status == "error":
+            self.error += 1
+
+    def add(self, index: int, row: dict[str, Any]) -> None:
+        self._pending[index] = row
+        while self._next_index in self._pending:
+            self._write(self._pending.pop(self._next_index))
+            self._next_index += 1
+
+    def close(self) -> None:
+        for index in sorted(self._pending):
+            self._write(self._pending.pop(index))
+        self._handle.close()
+
+    def iter_lines(self) -> Iterator[str]:
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.rstrip("\n")
+                if line:
+                    yield line
+
+
+def write_envelope_streaming(output: Path, metadata: dict[str, Any], lines: Iterable[str], pretty: bool = False) -> None:
+    """Wrap pre-serialized item lines in the metadata envelope without holding all rows in memory."""
+    tmp_path = output.with_suffix(output.suffix + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as out:
+        if pretty:
+            meta_text = json.dumps(metadata, indent=2).replace("\n", "\n  ")
+            out.write('{\n  "metadata": ' + meta_text + ',\n  "items": [')
+            first = True
+            for line in lines:
+                out.write("\n    " + line if first else ",\n    " + line)
+                first = False
+            out.write("]\n}\n" if first else "\n  ]\n}\n")
+        else:
+            out.write('{"metadata":' + json.dumps(metadata, separators=(",", ":")) + ',"items":[')
+            first = True
+            for line in lines:
+                out.write(line if first else "," + line)
+                first = False
+            out.write("]}")
+    os.replace(tmp_path, output)
 
 
 def load_dotenv_if_present() -> None:
@@ -48,53 +147,122 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--model", default=os.environ.get("OPENAI_MODEL", "gpt-4.1-mini"))
     parser.add_argument("--base-url", default=os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1"))
     parser.add_argument("--timeout", type=int, default=int(os.environ.get("OPENAI_TIMEOUT_MS", "15000") or "15000"))
+    parser.add_argument("--concurrency", type=int, default=8, help="Max OpenAI calls in flight at once (default: 8)")
+    parser.add_argument("--max-retries", type=int, default=4, help="Attempts per event for 429/5xx responses (default: 4)")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="Directory for cached OpenAI responses")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk OpenAI response cache")
+    parser.add_argument("--batch", action="store_true", help="Force the OpenAI Batch API regardless of event count")
+    parser.add_argument(
+        "--batch-threshold",
+        type=int,
+        default=50,
+        help="Use the OpenAI Batch API when reviewing more than this many events (0 disables auto-batching; default: 50)",
+    )
+    parser.add_argument("--batch-poll-seconds", type=int, default=30, help="Seconds between Batch API status polls (default: 30)")
+    parser.add_argument("--resume-batch", default=None, help="Poll an existing batch id instead of submitting a new one")
     parser.add_argument("--dry-run", action="store_true", help="Do not call OpenAI; write prompt-ready placeholders only")
+    parser.add_argument("--pretty", action="store_true", help="Indent the review sidecar for human reading (default: compact)")
     parser.add_argument("--force", action="store_true", help="Run even if ENABLE_LLM_EVENT_REVIEW is false")
     return parser.parse_args()
 
 
-def read_events() -> list[dict[str, Any]]:
-    payload = json.loads(EVENTS_PATH.read_text(encoding="utf-8"))
-    if not isinstance(payload, dict) or not isinstance(payload.get("items"), list):
-        raise ValueError(f"{EVENTS_PATH} must be an envelope with items[]")
-    rows = [row for row in payload["items"] if isinstance(row, dict)]
-    rows.sort(key=lambda row: (str(row.get("scene_id", "")), int(row.get("sequence_in_scene", 0)), str(row.get("event_id", ""))))
+def event_sort_key(row: dict[str, Any]) -> tuple[str, int, str]:
+    return (str(row.get("scene_id", "")), int(row.get("sequence_in_scene", 0)), str(row.get("event_id", "")))
+
+
+def read_events(limit: int | None = None) -> list[dict[str, Any]]:
+    """Return events in (scene_id, sequence_in_scene, event_id) order.
+
+    With a limit, a bounded heap keeps only the first `limit` events in sort
+    order — O(N log limit) time and O(limit) memory — instead of sorting the
+    full list.
+    """
+    if ijson is not None:
+        # Incremental parse keeps memory at O(events kept) instead of O(file size).
+        with EVENTS_PATH.open("rb") as handle:
+            source = (row for row in ijson.items(handle, "items.item") if isinstance(row, dict))
+            if limit is not None:
+                return heapq.nsmallest(limit, source, key=event_sort_key)
+            rows = list(source)
+    else:
+        payload = json_loads(EVENTS_PATH.read_bytes())
+        if not isinstance(payload, dict) or not isinstance(payload.get("items"), list):
+            raise ValueError(f"{EVENTS_PATH} must be an envelope with items[]")
+        rows = [row for row in payload["items"] if isinstance(row, dict)]
+    if limit is not None:
+        return heapq.nsmallest(limit, rows, key=event_sort_key)
+    rows.sort(key=event_sort_key)
     return rows
 
 
+SYSTEM_PROMPT = (
+    "You are reviewing an extracted screenplay event summary. "
+    "Provide a clearer candidate summary without adding new facts. "
+    "Preserve ambiguity and uncertainty. Return JSON with keys refined_summary and notes."
+)
+
+# event_prompt is pure w.r.t. the event dict, so rendered prompts are memoized
+# per event object (identity-checked to guard against id() reuse).
+_PROMPT_CACHE: dict[int, tuple[dict[str, Any], tuple[str, str]]] = {}
+
+
 def event_prompt(event: dict[str, Any]) -> tuple[str, str]:
-    event_id = str(event.get("event_id", ""))
-    scene_id = str(event.get("scene_id", ""))
-    event_type_l1 = str(event.get("event_type_l1", ""))
-    event_type_l2 = str(event.get("event_type_l2", ""))
-    summary = str(event.get("summary", ""))
-    confidence = event.get("confidence")
-    participants = event.get("participants") if isinstance(event.get("participants"), list) else []
-    participant_lines = []
+    cached = _PROMPT_CACHE.get(id(event))
+    if cached is not None and cached[0] is event:
+        return cached[1]
+
+    get = event.get
+    participants = get("participants")
+    if not isinstance(participants, list):
+        participants = []
+    participant_lines = "\n".join(
+        f"- {p.get('entity_id', '')} ({p.get('role', '')})" for p in participants[:8] if isinstance(p, dict)
+    ) or "- (none)"
+
+    user = (
+        f"event_id: {get('event_id', '')}\n"
+        f"scene_id: {get('scene_id', '')}\n"
+        f"event_type_l1: {get('event_type_l1', '')}\n"
+        f"event_type_l2: {get('event_type_l2', '')}\n"
+        f"confidence: {get('confidence')}\n"
+        "participants:\n"
+        f"{participant_lines}\n"
+        "original_summary:\n"
+        f"{get('summary', '')}"
+    )
+    prompts = (SYSTEM_PROMPT, user)
+    _PROMPT_CACHE[id(event)] = (event, prompts)
+    return prompts
+
+
+def event_prompt_preview(event: dict[str, Any], limit: int = 300) -> str:
+    """First `limit` characters of the user prompt without rendering the rest (dry-run fast path)."""
+    get = event.get
+    text = (
+        f"event_id: {get('event_id', '')}\n"
+        f"scene_id: {get('scene_id', '')}\n"
+        f"event_type_l1: {get('event_type_l1', '')}\n"
+        f"event_type_l2: {get('event_type_l2', '')}\n"
+        f"confidence: {get('confidence')}\n"
+        "participants:"
+    )
+    if len(text) >= limit:
+        return text[:limit]
+    participants = get("participants")
+    if not isinstance(participants, list):
+        participants = []
+    rendered_any = False
     for p in participants[:8]:
         if not isinstance(p, dict):
             continue
-        participant_lines.append(f"- {p.get('entity_id', '')} ({p.get('role', '')})")
-
-    system = (
-        "You are reviewing an extracted screenplay event summary. "
-        "Provide a clearer candidate summary without adding new facts. "
-        "Preserve ambiguity and uncertainty. Return JSON with keys refined_summary and notes."
-    )
-    user = "\n".join(
-        [
-            f"event_id: {event_id}",
-            f"scene_id: {scene_id}",
-            f"event_type_l1: {event_type_l1}",
-            f"event_type_l2: {event_type_l2}",
-            f"confidence: {confidence}",
-            "participants:",
-            *(participant_lines or ["- (none)"]),
-            "original_summary:",
-            summary,
-        ]
-    )
-    return system, user
+        rendered_any = True
+        text += f"\n- {p.get('entity_id', '')} ({p.get('role', '')})"
+        if len(text) >= limit:
+            return text[:limit]
+    if not rendered_any:
+        text += "\n- (none)"
+    text += f"\noriginal_summary:\n{get('summary', '')}"
+    return text[:limit]
 
 
 def extract_output_text(payload: dict[str, Any]) -> str:
@@ -123,9 +291,89 @@ def extract_output_text(payload: dict[str, Any]) -> str:
     return ""
 
 
-def call_openai(base_url: str, api_key: str, model: str, system: str, user: str, timeout_ms: int) -> dict[str, Any]:
-    url = base_url.rstrip("/") + "/responses"
-    body = {
+RETRYABLE_OPENAI_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class OpenAIHTTPError(RuntimeError):
+    def __init__(self, status: int, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+def openai_http_request(
+    url: str,
+    api_key: str,
+    *,
+    method: str = "GET",
+    data: bytes | None = None,
+    content_type: str = "application/json",
+    timeout_ms: int = 15000,
+) -> bytes:
+    # This client never decompresses responses, so ask for identity encoding up front.
+    headers = {"Authorization": f"Bearer {api_key}", "Accept-Encoding": "identity"}
+    if data is not None:
+        headers["Content-Type"] = content_type
+    try:
+        status, payload, response_headers = SHARED_POOL.request(method, url, headers, data, max(1.0, timeout_ms / 1000))
+    except (http.client.HTTPException, OSError) as exc:
+        raise RuntimeError(f"OpenAI network error: {exc}") from exc
+    if status >= 400:
+        retry_after: float | None = None
+        raw_retry_after = response_headers.get("Retry-After")
+        if raw_retry_after:
+            try:
+                retry_after = float(raw_retry_after)
+            except ValueError:
+                retry_after = None
+        raise OpenAIHTTPError(status, f"OpenAI HTTP {status}: {payload.decode('utf-8', 'replace')[:300]}", retry_after)
+    return payload
+
+
+def cache_key(model: str, system: str, user: str) -> str:
+    """Deterministic key over everything that affects the response (sampling params are constants below)."""
+    material = json.dumps(
+        {"model": model, "system": system, "user": user, "temperature": 0.2, "max_output_tokens": 300},
+        sort_keys=True,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def read_cached_response(cache_dir: Path, key: str) -> dict[str, Any] | None:
+    cache_path = cache_dir / f"{key}.json"
+    if not cache_path.is_file():
+        return None
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def write_cached_response(cache_dir: Path, key: str, payload: dict[str, Any]) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = cache_dir / f"{key}.json"
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    try:
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+_REQUEST_METADATA = {
+    "app": "irishman-narrative-trace-explorer",
+    "purpose": "event_review",
+    "phase": "phase7",
+}
+
+# Serialized request skeleton per model: only the system/user text varies between
+# events, so everything else is encoded once and the two strings spliced in.
+_SERIALIZED_TEMPLATES: dict[str, tuple[str, str, str]] = {}
+
+
+def build_request_body(model: str, system: str, user: str) -> dict[str, Any]:
+    return {
         "model": model,
         "input": [
             {"role": "system", "content": [{"type": "input_text", "text": system}]},
@@ -133,30 +381,291 @@ def call_openai(base_url: str, api_key: str, model: str, system: str, user: str,
         ],
         "temperature": 0.2,
         "max_output_tokens": 300,
-        "metadata": {
-            "app": "irishman-narrative-trace-explorer",
-            "purpose": "event_review",
-            "phase": "phase7",
-        },
+        "metadata": _REQUEST_METADATA,
     }
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(body).encode("utf-8"),
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}",
-        },
+
+
+def serialize_request_body(model: str, system: str, user: str) -> bytes:
+    template = _SERIALIZED_TEMPLATES.get(model)
+    if template is None:
+        head = json.dumps(model).join(
+            ('{"model": ', ', "input": [{"role": "system", "content": [{"type": "input_text", "text": ')
+        )
+        mid = '}]}, {"role": "user", "content": [{"type": "input_text", "text": '
+        tail = '}]}], "temperature": 0.2, "max_output_tokens": 300, "metadata": ' + json.dumps(_REQUEST_METADATA) + "}"
+        template = (head, mid, tail)
+        _SERIALIZED_TEMPLATES[model] = template
+    head, mid, tail = template
+    return (head + json.dumps(system) + mid + json.dumps(user) + tail).encode("utf-8")
+
+
+def call_openai(
+    base_url: str, api_key: str, model: str, system: str, user: str, timeout_ms: int, max_retries: int = 4
+) -> dict[str, Any]:
+    url = base_url.rstrip("/") + "/responses"
+    data = serialize_request_body(model, system, user)
+    attempts = max(1, max_retries)
+    for attempt in range(1, attempts + 1):
+        try:
+            raw = openai_http_request(url, api_key, method="POST", data=data, timeout_ms=timeout_ms)
+        except OpenAIHTTPError as exc:
+            # Transient ratelimit/5xx responses become latency instead of a dead row.
+            if exc.status in RETRYABLE_OPENAI_CODES and attempt < attempts:
+                delay = exc.retry_after if exc.retry_after is not None else min(2**attempt, 30)
+                time.sleep(delay + random.random())
+                continue
+            raise
+        return json_loads(raw)
+    raise RuntimeError("unreachable")
+
+
+def openai_api_request(
+    url: str, api_key: str, *, method: str = "GET", body: dict[str, Any] | None = None, timeout_ms: int = 15000
+) -> dict[str, Any]:
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    raw = openai_http_request(url, api_key, method=method, data=data, timeout_ms=timeout_ms)
+    return json_loads(raw)
+
+
+def upload_batch_input(base_url: str, api_key: str, jsonl_bytes: bytes, timeout_ms: int) -> str:
+    """Upload the batch input JSONL to /files (purpose=batch) and return the file id."""
+    boundary = "----irishman-batch-" + hashlib.sha256(jsonl_bytes).hexdigest()[:16]
+    parts = [
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"purpose\"\r\n\r\nbatch\r\n".encode("utf-8"),
+        (
+            f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"event_review_batch.jsonl\"\r\n"
+            "Content-Type: application/jsonl\r\n\r\n"
+        ).encode("utf-8"),
+        jsonl_bytes,
+        f"\r\n--{boundary}--\r\n".encode("utf-8"),
+    ]
+    raw = openai_http_request(
+        base_url.rstrip("/") + "/files",
+        api_key,
         method="POST",
+        data=b"".join(parts),
+        content_type=f"multipart/form-data; boundary={boundary}",
+        timeout_ms=timeout_ms,
+    )
+    payload = json.loads(raw.decode("utf-8", "replace"))
+    file_id = payload.get("id") if isinstance(payload, dict) else None
+    if not isinstance(file_id, str) or not file_id:
+        raise RuntimeError("Batch input upload returned no file id")
+    return file_id
+
+
+def download_file_content(base_url: str, api_key: str, file_id: str, timeout_ms: int) -> str:
+    raw = openai_http_request(base_url.rstrip("/") + f"/files/{file_id}/content", api_key, timeout_ms=timeout_ms)
+    return raw.decode("utf-8", "replace")
+
+
+def poll_batch_until_done(base_url: str, api_key: str, batch_id: str, poll_seconds: int, timeout_ms: int) -> dict[str, Any]:
+    terminal = {"completed", "failed", "expired", "cancelled"}
+    while True:
+        batch = openai_api_request(base_url.rstrip("/") + f"/batches/{batch_id}", api_key, timeout_ms=timeout_ms)
+        status = batch.get("status")
+        if status in terminal:
+            return batch
+        print(f"batch {batch_id}: status={status}; polling again in {poll_seconds}s", file=sys.stderr)
+        time.sleep(max(1, poll_seconds))
+
+
+def build_base_row(index: int, event: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "event_id": str(event.get("event_id", f"idx_{index}")),
+        "scene_id": event.get("scene_id"),
+        "event_type_l2": event.get("event_type_l2"),
+        "original_summary": event.get("summary"),
+        "status": "pending",
+    }
+
+
+def build_dry_run_row(index: int, event: dict[str, Any]) -> dict[str, Any]:
+    row = build_base_row(index, event)
+    row.update(
+        {
+            "status": "dry_run",
+            "refined_summary_candidate": event.get("summary"),
+            "notes": "Dry run; no OpenAI call executed.",
+            "prompt_preview": event_prompt_preview(event),
+        }
+    )
+    return row
+
+
+def apply_response_payload(row: dict[str, Any], payload: dict[str, Any], fallback_model: str, status: str = "ok") -> None:
+    text = extract_output_text(payload)
+    parsed_json: dict[str, Any] | None = None
+    if text:
+        try:
+            maybe_obj = json.loads(text)
+            if isinstance(maybe_obj, dict):
+                parsed_json = maybe_obj
+        except json.JSONDecodeError:
+            parsed_json = None
+    row.update(
+        {
+            "status": status,
+            "refined_summary_candidate": (
+                parsed_json.get("refined_summary") if parsed_json and isinstance(parsed_json.get("refined_summary"), str) else text
+            ),
+            "notes": (
+                parsed_json.get("notes") if parsed_json and isinstance(parsed_json.get("notes"), str) else ""
+            ),
+            "openai_response_id": payload.get("id") if isinstance(payload, dict) else None,
+            "model": payload.get("model") if isinstance(payload, dict) else fallback_model,
+        }
     )
+
+
+def review_prepared_event(
+    index: int, event: dict[str, Any], system: str, user: str, args: argparse.Namespace, api_key: str
+) -> tuple[dict[str, Any], str, dict[str, Any] | None]:
+    """Review one pre-rendered prompt; returns the row plus (key, payload) when a fresh response needs caching."""
+    row = build_base_row(index, event)
+    fresh_payload: dict[str, Any] | None = None
     try:
-        with urllib.request.urlopen(req, timeout=max(1, timeout_ms / 1000)) as response:
-            raw = response.read().decode("utf-8", "replace")
-            return json.loads(raw)
-    except urllib.error.HTTPError as exc:
-        raw = exc.read().decode("utf-8", "replace") if hasattr(exc, "read") else ""
-        raise RuntimeError(f"OpenAI HTTP {exc.code}: {raw[:300]}") from exc
-    except urllib.error.URLError as exc:
-        raise RuntimeError(f"OpenAI network error: {exc.reason}") from exc
+        key = cache_key(args.model, system, user)
+        payload = None if args.no_cache else read_cached_response(args.cache_dir, key)
+        cache_hit = payload is not None
+        if payload is None:
+            payload = call_openai(args.base_url, api_key, args.model, system, user, args.timeout, args.max_retries)
+            if isinstance(payload, dict):
+                fresh_payload = payload
+        apply_response_payload(row, payload, args.model, status="ok_cached" if cache_hit else "ok")
+    except Exception as exc:  # noqa: BLE001
+        row.update({"status": "error", "error": str(exc)})
+        key = ""
+    return row, key, fresh_payload
+
+
+async def review_events_concurrently(
+    selected: list[dict[str, Any]], args: argparse.Namespace, api_key: str, sink: RowSink
+) -> None:
+    """Producer/worker/writer pipeline bounded by --concurrency.
+
+    Prompt rendering (producer), OpenAI calls (workers), and persistence
+    (writer) overlap, so local JSON work hides inside network waits. Queues are
+    bounded to 2x the worker count for backpressure; the sink restores event
+    order as rows stream out.
+    """
+    worker_count = max(1, args.concurrency)
+    work_queue: asyncio.Queue = asyncio.Queue(maxsize=2 * worker_count)
+    result_queue: asyncio.Queue = asyncio.Queue(maxsize=2 * worker_count)
+
+    async def producer() -> None:
+        for index, event in enumerate(selected, start=1):
+            system, user = event_prompt(event)
+            await work_queue.put((index, event, system, user))
+        for _ in range(worker_count):
+            await work_queue.put(None)
+
+    async def worker() -> None:
+        while True:
+            item = await work_queue.get()
+            if item is None:
+                return
+            index, event, system, user = item
+            row, key, fresh_payload = await asyncio.to_thread(
+                review_prepared_event, index, event, system, user, args, api_key
+            )
+            await result_queue.put((index, row, key, fresh_payload))
+
+    async def writer() -> None:
+        for _ in range(len(selected)):
+            index, row, key, fresh_payload = await result_queue.get()
+            if fresh_payload is not None and not args.no_cache and key:
+                await asyncio.to_thread(write_cached_response, args.cache_dir, key, fresh_payload)
+            sink.add(index, row)
+
+    await asyncio.gather(producer(), *(worker() for _ in range(worker_count)), writer())
+
+
+def review_events_via_batch(
+    selected: list[dict[str, Any]], args: argparse.Namespace, api_key: str
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Review events through the OpenAI Batch API (half-price, no per-request RTT); cache hits stay local."""
+    rows: list[dict[str, Any]] = []
+    pending: list[tuple[dict[str, Any], str]] = []
+    request_lines: list[str] = []
+    for index, event in enumerate(selected, start=1):
+        system, user = event_prompt(event)
+        row = build_base_row(index, event)
+        rows.append(row)
+        key = cache_key(args.model, system, user)
+        cached = None if args.no_cache else read_cached_response(args.cache_dir, key)
+        if cached is not None:
+            apply_response_payload(row, cached, args.model, status="ok_cached")
+            continue
+        pending.append((row, key))
+        request_lines.append(
+            json.dumps(
+                {
+                    "custom_id": row["event_id"],
+                    "method": "POST",
+                    "url": "/v1/responses",
+                    "body": build_request_body(args.model, system, user),
+                }
+            )
+        )
+
+    if not pending:
+        return rows, None
+
+    base_url = args.base_url.rstrip("/")
+    if args.resume_batch:
+        batch_id = str(args.resume_batch)
+        print(f"Resuming batch {batch_id}", file=sys.stderr)
+    else:
+        jsonl_bytes = ("\n".join(request_lines) + "\n").encode("utf-8")
+        file_id = upload_batch_input(base_url, api_key, jsonl_bytes, args.timeout)
+        batch = openai_api_request(
+            base_url + "/batches",
+            api_key,
+            method="POST",
+            body={"input_file_id": file_id, "endpoint": "/v1/responses", "completion_window": "24h"},
+            timeout_ms=args.timeout,
+        )
+        batch_id = batch.get("id") if isinstance(batch.get("id"), str) else ""
+        if not batch_id:
+            raise RuntimeError("Batch creation returned no batch id")
+        print(f"Submitted batch {batch_id} with {len(pending)} events", file=sys.stderr)
+
+    batch = poll_batch_until_done(base_url, api_key, batch_id, args.batch_poll_seconds, args.timeout)
+    status = batch.get("status")
+    if status != "completed":
+        for row, _ in pending:
+            row.update({"status": "error", "error": f"batch {batch_id} ended with status {status}"})
+        return rows, batch_id
+
+    output_file_id = batch.get("output_file_id")
+    if not isinstance(output_file_id, str) or not output_file_id:
+        raise RuntimeError(f"batch {batch_id} completed without an output_file_id")
+    payload_by_custom_id: dict[str, dict[str, Any]] = {}
+    for line in download_file_content(base_url, api_key, output_file_id, args.timeout).splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(record, dict):
+            continue
+        custom_id = record.get("custom_id")
+        response = record.get("response")
+        body = response.get("body") if isinstance(response, dict) else None
+        if isinstance(custom_id, str) and isinstance(body, dict):
+            payload_by_custom_id[custom_id] = body
+
+    for row, key in pending:
+        payload = payload_by_custom_id.get(row["event_id"])
+        if payload is None:
+            row.update({"status": "error", "error": f"batch {batch_id} returned no output for this event"})
+            continue
+        if not args.no_cache:
+            write_cached_response(args.cache_dir, key, payload)
+        apply_response_payload(row, payload, args.model, status="ok_batch")
+    return rows, batch_id
 
 
 def main() -> int:
@@ -177,85 +686,50 @@ def main() -> int:
         print("error: OPENAI_API_KEY is required unless --dry-run is used", file=sys.stderr)
         return 2
 
-    events = read_events()
+    events = read_events(limit=max(1, args.limit))
     limit = max(1, min(args.limit, len(events))) if events else 0
     selected = events[:limit]
 
-    output_records: list[dict[str, Any]] = []
     started = time.time()
+    batch_id: str | None = None
 
-    for index, event in enumerate(selected, start=1):
-        system, user = event_prompt(event)
-        event_id = str(event.get("event_id", f"idx_{index}"))
-        row: dict[str, Any] = {
-            "event_id": event_id,
-            "scene_id": event.get("scene_id"),
-            "event_type_l2": event.get("event_type_l2"),
-            "original_summary": event.get("summary"),
-            "status": "pending",
-        }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = args.output.with_name(args.output.name + ".partial.jsonl")
+    sink = RowSink(partial_path)
 
+    use_batch = bool(args.batch or args.resume_batch) or (
+        args.batch_threshold > 0 and len(selected) > args.batch_threshold
+    )
+    try:
         if args.dry_run:
-            row.update(
-                {
-                    "status": "dry_run",
-                    "refined_summary_candidate": event.get("summary"),
-                    "notes": "Dry run; no OpenAI call executed.",
-                    "prompt_preview": user[:300],
-                }
-            )
-            output_records.append(row)
-            continue
-
-        try:
-            payload = call_openai(args.base_url, api_key, args.model, system, user, args.timeout)
-            text = extract_output_text(payload)
-            parsed_json: dict[str, Any] | None = None
-            if text:
-                try:
-                    maybe_obj = json.loads(text)
-                    if isinstance(maybe_obj, dict):
-                        parsed_json = maybe_obj
-                except json.JSONDecodeError:
-                    parsed_json = None
-            row.update(
-                {
-                    "status": "ok",
-                    "refined_summary_candidate": (
-                        parsed_json.get("refined_summary") if parsed_json and isinstance(parsed_json.get("refined_summary"), str) else text
-                    ),
-                    "notes": (
-                        parsed_json.get("notes") if parsed_json and isinstance(parsed_json.get("notes"), str) else ""
-                    ),
-                    "openai_response_id": payload.get("id") if isinstance(payload, dict) else None,
-                    "model": payload.get("model") if isinstance(payload, dict) else args.model,
-                }
-            )
-        except Exception as exc:  # noqa: BLE001
-            row.update({"status": "error", "error": str(exc)})
-        output_records.append(row)
-
-    args.output.parent.mkdir(parents=True, exist_ok=True)
-    output_payload = {
-        "metadata": {
-            "artifact_type": "llm_event_refinement_review",
-            "schema_version": "0.1.0-draft",
-            "pipeline_version": "phase7-llm-event-review",
-            "build_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            "record_count": len(output_records),
-            "dry_run": bool(args.dry_run),
-            "model": args.model,
-            "feature_flag_enabled": enabled_flag,
-            "duration_seconds": round(time.time() - started, 3),
-        },
-        "items": output_records,
+            for index, event in enumerate(selected, start=1):
+                sink.add(index, build_dry_run_row(index, event))
+        elif use_batch:
+            rows, batch_id = review_events_via_batch(selected, args, api_key)
+            for index, row in enumerate(rows, start=1):
+                sink.add(index, row)
+        else:
+            asyncio.run(review_events_concurrently(selected, args, api_key, sink))
+    finally:
+        sink.close()
+
+    metadata = {
+        "artifact_type": "llm_event_refinement_review",
+        "schema_version": "0.1.0-draft",
+        "pipeline_version": "phase7-llm-event-review",
+        "build_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "record_count": sink.count,
+        "dry_run": bool(args.dry_run),
+        "model": args.model,
+        "feature_flag_enabled": enabled_flag,
+        "batch_id": batch_id,
+        "duration_seconds": round(time.time() - started, 3),
     }
-    args.output.write_text(json.dumps(output_payload, indent=2), encoding="utf-8")
+    write_envelope_streaming(args.output, metadata, sink.iter_lines(), pretty=args.pretty)
+    partial_path.unlink(missing_ok=True)
 
-    ok_count = sum(1 for row in output_records if row.get("status") in {"ok", "dry_run"})
-    err_count = sum(1 for row in output_records if row.get("status") == "error")
-    print(f"Wrote {args.output} | reviewed={len(output_records)} ok={ok_count} error={err_count}")
-    return 0 if err_count == 0 else 1
+    print(f"Wrote {args.output} | reviewed={sink.count} ok={sink.ok} error={sink.error}")
+    return 0 if sink.error == 0 else 1
 
 
 if __name__ == "__main__":
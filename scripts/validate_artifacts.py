@@ -4,15 +4,34 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
 import json
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable
+
+try:
+    import ijson  # optional: streams large artifacts instead of materializing them
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: C JSON parser, noticeably faster on the larger artifacts
+except ImportError:
+    orjson = None
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
+# Top-level directories that contain every artifact this script checks; the
+# presence index walks only these (plus the repo root), never node_modules.
+PRESENCE_INDEX_ROOTS = ("app", "config", "data", "docs", "scripts", "src")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Requirement:
     path: str
     kind: str = "file"  # "file" or "dir"
@@ -108,33 +127,231 @@ GENERATED_PHASE_OUTPUTS: list[Requirement] = [
     Requirement("README.md", phase=8),
 ]
 
-PHASE1_ENVELOPE_PATHS = {
-    "data/intermediate/script_blocks.json",
-    "data/intermediate/scenes.json",
-    "data/intermediate/utterances.json",
-    "data/intermediate/action_beats.json",
-}
 
-PHASE2_ENVELOPE_PATHS = {
-    "data/derived/entities.json",
-    "data/derived/entity_aliases.json",
-    "data/derived/kg_edges.json",
+def _bucket_by_phase(requirements: Iterable[Requirement]) -> dict[int, tuple[Requirement, ...]]:
+    buckets: dict[int, list[Requirement]] = {}
+    for req in requirements:
+        buckets.setdefault(req.phase, []).append(req)
+    return {phase: tuple(reqs) for phase, reqs in buckets.items()}
+
+
+_SCAFFOLD_BY_PHASE = _bucket_by_phase(SCAFFOLD_REQUIREMENTS)
+_GENERATED_BY_PHASE = _bucket_by_phase(GENERATED_PHASE_OUTPUTS)
+
+
+@functools.lru_cache(maxsize=9)
+def requirements_for_phase(phase: int) -> tuple[tuple[Requirement, ...], tuple[Requirement, ...], tuple[Requirement, ...]]:
+    """(scaffold required, generated required, generated later) for one --phase value."""
+    scaffold = tuple(itertools.chain.from_iterable(_SCAFFOLD_BY_PHASE.get(p, ()) for p in range(phase + 1)))
+    generated = tuple(itertools.chain.from_iterable(_GENERATED_BY_PHASE.get(p, ()) for p in range(phase + 1)))
+    later = tuple(itertools.chain.from_iterable(_GENERATED_BY_PHASE.get(p, ()) for p in range(phase + 1, 9)))
+    return scaffold, generated, later
+
+
+# Envelope artifacts checked from each phase onward; tuples keep report order stable.
+PHASE_ENVELOPES: dict[int, tuple[str, ...]] = {
+    1: (
+        "data/intermediate/script_blocks.json",
+        "data/intermediate/scenes.json",
+        "data/intermediate/utterances.json",
+        "data/intermediate/action_beats.json",
+    ),
+    2: (
+        "data/derived/entities.json",
+        "data/derived/entity_aliases.json",
+        "data/derived/kg_edges.json",
+    ),
+    3: (
+        "data/derived/events.json",
+        "data/derived/event_participants.json",
+        "data/derived/scene_index.json",
+    ),
+    4: (
+        "data/derived/temporal_edges.json",
+        "data/derived/state_changes.json",
+    ),
+    5: (
+        "data/derived/query_examples.json",
+    ),
 }
 
-PHASE3_ENVELOPE_PATHS = {
-    "data/derived/events.json",
-    "data/derived/event_participants.json",
-    "data/derived/scene_index.json",
-}
+ENTITIES_REQUIRED_KEYS = frozenset({"entity_id", "entity_type", "canonical_name", "aliases", "first_scene_id", "metadata"})
 
-PHASE4_ENVELOPE_PATHS = {
-    "data/derived/temporal_edges.json",
-    "data/derived/state_changes.json",
-}
+ENTITY_ALIASES_REQUIRED_KEYS = frozenset({"alias_raw", "alias_normalized", "entity_id", "entity_type", "alias_kind", "source"})
 
-PHASE5_ENVELOPE_PATHS = {
-    "data/derived/query_examples.json",
-}
+KG_EDGES_REQUIRED_KEYS = frozenset({"edge_id", "subject_id", "predicate", "object_id", "stability", "evidence_refs"})
+
+EVENTS_REQUIRED_KEYS = frozenset(
+    {
+        "event_id",
+        "scene_id",
+        "event_type_l1",
+        "event_type_l2",
+        "summary",
+        "participants",
+        "evidence_refs",
+        "sequence_in_scene",
+        "confidence",
+        "extraction_method",
+    }
+)
+
+EVENT_PARTICIPANTS_REQUIRED_KEYS = frozenset(
+    {
+        "event_participant_id",
+        "event_id",
+        "scene_id",
+        "entity_id",
+        "role",
+        "participant_index",
+        "evidence_refs",
+    }
+)
+
+SCENE_INDEX_REQUIRED_KEYS = frozenset({"scene_id", "scene_index", "event_ids", "event_count", "event_refs"})
+
+TEMPORAL_EDGES_REQUIRED_KEYS = frozenset({"temporal_edge_id", "from_event_id", "to_event_id", "relation", "basis"})
+
+STATE_CHANGES_REQUIRED_KEYS = frozenset(
+    {
+        "state_change_id",
+        "subject_id",
+        "object_id",
+        "state_dimension",
+        "direction",
+        "scene_id",
+        "trigger_event_ids",
+        "evidence_refs",
+        "confidence",
+        "inference_method",
+        "claim_type",
+    }
+)
+
+QUERY_EXAMPLES_REQUIRED_KEYS = frozenset({"query_id", "question", "query_type_expected", "mode_expected"})
+
+VALID_CLAIM_TYPES = frozenset({"explicit", "inferred"})
+
+# Ordered key tables iterated for error messages; tuples, built once.
+MANIFEST_SUMMARY_KEYS = (
+    "scene_count_total",
+    "scene_count_explicit_headers",
+    "scene_count_synthetic",
+    "utterance_count",
+    "action_beat_count",
+    "script_block_count",
+)
+
+TAXONOMY_SUMMARY_KEYS = ("total_events", "unknown_event_type_count", "unmapped_review_required_count")
+
+STATE_CHANGE_RULE_KEYS = ("rule_id", "subject_id", "object_id", "state_dimension", "direction", "claim_type")
+
+PARSER_QUALITY_SUMMARY_KEYS = (
+    "release_gate_passed",
+    "total_checks",
+    "passed_checks",
+    "failed_checks",
+    "explicit_scene_header_count_target",
+    "explicit_scene_header_count_actual",
+)
+
+README_REQUIRED_SECTIONS = (
+    "## What It Demonstrates",
+    "## Setup",
+    "## Local-Only Disclaimer",
+)
+
+VALID_QUERY_TYPES = frozenset({"fact", "timeline", "state_change", "causal_chain", "evidence", "comparison"})
+
+VALID_MODES = frozenset({"kg", "ntg", "hybrid", "baseline_rag"})
+
+
+def _compile_item_validator(
+    required: frozenset[str],
+    list_keys: tuple[str, ...] = (),
+    enum_keys: tuple[tuple[str, frozenset[str]], ...] = (),
+):
+    """Compile one artifact's per-item shape checks into a closure built once at import."""
+
+    def check_items(items: list, sample: int) -> tuple[bool, str]:
+        for idx, item in enumerate(items[:sample]):
+            # json/orjson only ever produce exact builtin types, so the
+            # identity checks here skip isinstance's subclass walk.
+            if type(item) is not dict:
+                return False, f"Item {idx} is not an object"
+            # The dict-view >= comparison probes only the required keys; no
+            # per-item set is built, and the sorted diff runs on failure only.
+            if not item.keys() >= required:
+                missing = sorted(required - item.keys())
+                return False, f"Item {idx} missing keys: {', '.join(missing)}"
+            for key in list_keys:
+                if type(item.get(key)) is not list:
+                    return False, f"Item {idx} {key} must be a list"
+            for key, allowed in enum_keys:
+                value = item.get(key)
+                if value not in allowed:
+                    return False, f"Item {idx} invalid {key}: {value}"
+        return True, "OK"
+
+    return check_items
+
+
+def _codegen_item_validator(
+    name: str,
+    required: frozenset[str],
+    list_keys: tuple[str, ...] = (),
+    enum_keys: tuple[tuple[str, frozenset[str]], ...] = (),
+):
+    """exec-compiled variant of _compile_item_validator for the hottest artifacts.
+
+    Unrolls the per-key probes into straight-line 'in' tests so the generated
+    function carries no set or tuple iteration on the happy path. Contract and
+    failure messages are identical to the closure version.
+    """
+    lines = [
+        f"def {name}(items, sample):",
+        "    for idx, item in enumerate(items[:sample]):",
+        "        if type(item) is not dict:",
+        '            return False, f"Item {idx} is not an object"',
+    ]
+    for key in sorted(required):
+        lines += [
+            f"        if {key!r} not in item:",
+            "            missing = sorted(_required - item.keys())",
+            "            return False, f\"Item {idx} missing keys: {', '.join(missing)}\"",
+        ]
+    for key in list_keys:
+        lines += [
+            f"        if type(item.get({key!r})) is not list:",
+            f'            return False, f"Item {{idx}} {key} must be a list"',
+        ]
+    for pos, (key, _allowed) in enumerate(enum_keys):
+        lines += [
+            f"        value = item.get({key!r})",
+            f"        if value not in _allowed_{pos}:",
+            f'            return False, f"Item {{idx}} invalid {key}: {{value}}"',
+        ]
+    lines.append('    return True, "OK"')
+    namespace: dict[str, Any] = {"_required": required}
+    for pos, (_key, allowed) in enumerate(enum_keys):
+        namespace[f"_allowed_{pos}"] = allowed
+    exec(compile("\n".join(lines), f"<generated {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_CHECK_ENTITIES_ITEMS = _compile_item_validator(ENTITIES_REQUIRED_KEYS, ("aliases",))
+_CHECK_ENTITY_ALIASES_ITEMS = _compile_item_validator(ENTITY_ALIASES_REQUIRED_KEYS)
+_CHECK_KG_EDGES_ITEMS = _compile_item_validator(KG_EDGES_REQUIRED_KEYS, ("evidence_refs",))
+_CHECK_EVENTS_ITEMS = _codegen_item_validator("check_events_items", EVENTS_REQUIRED_KEYS, ("participants", "evidence_refs"))
+_CHECK_EVENT_PARTICIPANTS_ITEMS = _compile_item_validator(EVENT_PARTICIPANTS_REQUIRED_KEYS, ("evidence_refs",))
+_CHECK_SCENE_INDEX_ITEMS = _compile_item_validator(SCENE_INDEX_REQUIRED_KEYS, ("event_ids", "event_refs"))
+_CHECK_TEMPORAL_EDGES_ITEMS = _compile_item_validator(TEMPORAL_EDGES_REQUIRED_KEYS)
+_CHECK_STATE_CHANGES_ITEMS = _codegen_item_validator(
+    "check_state_changes_items",
+    STATE_CHANGES_REQUIRED_KEYS,
+    ("trigger_event_ids", "evidence_refs"),
+    (("claim_type", VALID_CLAIM_TYPES),),
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -153,32 +370,73 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _index_repo(root: Path) -> dict[str, str]:
+    """One recursive os.scandir walk of the artifact roots: rel_path -> "file" | "dir"."""
+    index: dict[str, str] = {}
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                index[entry.name] = "dir" if entry.is_dir(follow_symlinks=False) else "file"
+    except OSError:
+        return index
+    stack = [prefix for prefix in PRESENCE_INDEX_ROOTS if index.get(prefix) == "dir"]
+    while stack:
+        rel = stack.pop()
+        try:
+            with os.scandir(root / rel) as entries:
+                for entry in entries:
+                    rel_child = f"{rel}/{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        index[rel_child] = "dir"
+                        stack.append(rel_child)
+                    else:
+                        index[rel_child] = "file"
+        except OSError:
+            continue
+    return index
+
+
+_PRESENCE_INDEX: dict[str, str] | None = None
+
+
+def _presence_index() -> dict[str, str]:
+    global _PRESENCE_INDEX
+    if _PRESENCE_INDEX is None:
+        _PRESENCE_INDEX = _index_repo(REPO_ROOT)
+    return _PRESENCE_INDEX
+
+
 def exists(req: Requirement) -> bool:
-    candidate = REPO_ROOT / req.path
-    if req.kind == "dir":
-        return candidate.is_dir()
-    return candidate.is_file()
+    kind = _presence_index().get(req.path)
+    if kind is not None:
+        return kind == req.kind
+    top = req.path.split("/", 1)[0]
+    if top in _presence_index() and (top in PRESENCE_INDEX_ROOTS or "/" not in req.path):
+        return False  # the walk covered this subtree, so absence is definitive
+    # One lstat covers both kinds; pathlib's is_dir/is_file would each stat again.
+    try:
+        st = os.stat(REPO_ROOT / req.path, follow_symlinks=False)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) if req.kind == "dir" else stat.S_ISREG(st.st_mode)
 
 
-def partition(requirements: Iterable[Requirement], phase: int) -> tuple[list[Requirement], list[Requirement]]:
-    required_now: list[Requirement] = []
-    later: list[Requirement] = []
-    for req in requirements:
-        if req.phase <= phase:
-            required_now.append(req)
-        else:
-            later.append(req)
-    return required_now, later
+def bulk_exists(requirements: Iterable[Requirement]) -> dict[str, bool]:
+    """Check every requirement at once, overlapping any stats that miss the index.
+
+    On a local disk the index answers almost everything, but on fuse/NFS mounts
+    the fallback stats dominate, so they are issued from a thread pool.
+    """
+    reqs = list(requirements)
+    _presence_index()  # build once up front instead of racing in the workers
+    with ThreadPoolExecutor(max_workers=min(32, max(1, len(reqs)))) as executor:
+        return dict(zip((req.path for req in reqs), executor.map(exists, reqs)))
 
 
 def validate_schema_versions() -> tuple[bool, str]:
-    path = REPO_ROOT / "data/derived/schema_versions.json"
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except FileNotFoundError:
-        return False, "Missing file"
-    except json.JSONDecodeError as exc:
-        return False, f"Invalid JSON: {exc}"
+    data, message = _load_json(REPO_ROOT / "data/derived/schema_versions.json")
+    if data is None:
+        return False, message
 
     if not isinstance(data, dict) or "artifact_schemas" not in data:
         return False, "Expected object with 'artifact_schemas'"
@@ -187,12 +445,22 @@ def validate_schema_versions() -> tuple[bool, str]:
     return True, "OK"
 
 
+@functools.lru_cache(maxsize=None)
 def _load_json(path: Path) -> tuple[dict | list | None, str]:
+    """Parse a JSON artifact once per run; several validators share the same file.
+
+    Callers must treat the returned payload as read-only.
+    """
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        raw = path.read_bytes()
+        # The smallest payload a validator can accept is "{}" or "[]"; anything
+        # shorter is a truncated write and not worth handing to the parser.
+        if len(raw) < 2:
+            return None, "Empty file"
+        payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except FileNotFoundError:
         return None, "Missing file"
-    except json.JSONDecodeError as exc:
+    except ValueError as exc:  # covers json.JSONDecodeError and orjson.JSONDecodeError
         return None, f"Invalid JSON: {exc}"
 
     if not isinstance(payload, (dict, list)):
@@ -200,21 +468,88 @@ def _load_json(path: Path) -> tuple[dict | list | None, str]:
     return payload, "OK"
 
 
-def validate_envelope_json(rel_path: str) -> tuple[bool, str]:
-    payload, message = _load_json(REPO_ROOT / rel_path)
+@dataclass(frozen=True, slots=True)
+class Envelope:
+    """Envelope pieces the validators actually look at: metadata plus a bounded items prefix."""
+
+    metadata: dict | None
+    items: list | None  # first `sample` items, or None when items is missing/not a list
+    item_count: int
+
+
+# ijson value-opening events at the items.item prefix; one per element.
+_ITEM_START_EVENTS = frozenset({"string", "number", "integer", "double", "boolean", "null", "start_map", "start_array"})
+
+
+def _load_envelope_ijson(path: Path, sample: int) -> tuple[Envelope | None, str]:
+    """Streaming envelope load: one scan for shape and item count, bounded re-reads for values."""
+    try:
+        saw_root = False
+        items_is_list = False
+        metadata_is_dict = False
+        item_count = 0
+        with path.open("rb") as handle:
+            for node_prefix, event, _value in ijson.parse(handle):
+                if not saw_root:
+                    if event != "start_map":
+                        return None, "Expected JSON object envelope"
+                    saw_root = True
+                elif node_prefix == "items" and event == "start_array":
+                    items_is_list = True
+                elif node_prefix == "metadata" and event == "start_map":
+                    metadata_is_dict = True
+                elif node_prefix == "items.item" and event in _ITEM_START_EVENTS:
+                    item_count += 1
+        metadata = None
+        if metadata_is_dict:
+            with path.open("rb") as handle:
+                metadata = next(ijson.items(handle, "metadata"), None)
+        items = None
+        if items_is_list:
+            with path.open("rb") as handle:
+                items = list(itertools.islice(ijson.items(handle, "items.item"), sample))
+    except FileNotFoundError:
+        return None, "Missing file"
+    except (ijson.JSONError, OSError) as exc:
+        return None, f"Invalid JSON: {exc}"
+    return Envelope(metadata=metadata, items=items, item_count=item_count), "OK"
+
+
+def _load_envelope(path: Path, sample: int) -> tuple[Envelope | None, str]:
+    """Load just the envelope pieces a validator needs.
+
+    With ijson installed the items tail is streamed and discarded, so memory
+    stays constant however large the artifact grows; otherwise this falls back
+    to the memoized _load_json.
+    """
+    if ijson is not None:
+        return _load_envelope_ijson(path, sample)
+    payload, message = _load_json(path)
     if payload is None:
-        return False, message
+        return None, message
     if not isinstance(payload, dict):
-        return False, "Expected JSON object envelope"
-    items = payload.get("items")
+        return None, "Expected JSON object envelope"
     metadata = payload.get("metadata")
-    if not isinstance(items, list):
+    items = payload.get("items")
+    envelope = Envelope(
+        metadata=metadata if isinstance(metadata, dict) else None,
+        items=items[:sample] if isinstance(items, list) else None,
+        item_count=len(items) if isinstance(items, list) else 0,
+    )
+    return envelope, "OK"
+
+
+def validate_envelope_json(rel_path: str) -> tuple[bool, str]:
+    envelope, message = _load_envelope(REPO_ROOT / rel_path, sample=0)
+    if envelope is None:
+        return False, message
+    if envelope.items is None:
         return False, "Missing/invalid 'items' array"
-    if not isinstance(metadata, dict):
+    if envelope.metadata is None:
         return False, "Missing/invalid 'metadata' object"
-    record_count = metadata.get("record_count")
-    if isinstance(record_count, int) and record_count != len(items):
-        return False, f"metadata.record_count ({record_count}) != len(items) ({len(items)})"
+    record_count = envelope.metadata.get("record_count")
+    if isinstance(record_count, int) and record_count != envelope.item_count:
+        return False, f"metadata.record_count ({record_count}) != len(items) ({envelope.item_count})"
     return True, "OK"
 
 
@@ -230,183 +565,94 @@ def validate_parser_manifest() -> tuple[bool, str]:
         return False, "Missing/invalid metadata"
     if not isinstance(summary, dict):
         return False, "Missing/invalid summary"
-    required_summary_keys = [
-        "scene_count_total",
-        "scene_count_explicit_headers",
-        "scene_count_synthetic",
-        "utterance_count",
-        "action_beat_count",
-        "script_block_count",
-    ]
-    missing = [key for key in required_summary_keys if key not in summary]
+    missing = [key for key in MANIFEST_SUMMARY_KEYS if key not in summary]
     if missing:
         return False, f"Missing summary keys: {', '.join(missing)}"
     return True, "OK"
 
 
-def validate_entities_artifact() -> tuple[bool, str]:
-    payload, message = _load_json(REPO_ROOT / "data/derived/entities.json")
-    if payload is None:
+def _validate_sampled_items(
+    rel_path: str, check_items: Callable[[list, int], tuple[bool, str]], sample: int
+) -> tuple[bool, str]:
+    """Shared unwrap for the item-sampling validators: load the envelope, then
+    run the artifact's compiled item checks over a bounded prefix — enough for
+    shape validation without huge cost."""
+    envelope, message = _load_envelope(REPO_ROOT / rel_path, sample)
+    if envelope is None:
         return False, message
-    if not isinstance(payload, dict):
-        return False, "Expected JSON object envelope"
-    items = payload.get("items")
-    if not isinstance(items, list):
+    if envelope.items is None:
         return False, "Missing items array"
-    required_keys = {"entity_id", "entity_type", "canonical_name", "aliases", "first_scene_id", "metadata"}
-    for idx, item in enumerate(items[:50]):  # sample enough for shape validation without huge cost
-        if not isinstance(item, dict):
-            return False, f"Item {idx} is not an object"
-        missing = sorted(required_keys - set(item.keys()))
-        if missing:
-            return False, f"Item {idx} missing keys: {', '.join(missing)}"
-        if not isinstance(item.get("aliases"), list):
-            return False, f"Item {idx} aliases must be a list"
-    return True, "OK"
+    return check_items(envelope.items, sample)
+
+
+def validate_entities_artifact() -> tuple[bool, str]:
+    return _validate_sampled_items("data/derived/entities.json", _CHECK_ENTITIES_ITEMS, 50)
 
 
 def validate_entity_aliases_artifact() -> tuple[bool, str]:
-    payload, message = _load_json(REPO_ROOT / "data/derived/entity_aliases.json")
-    if payload is None:
-        return False, message
-    if not isinstance(payload, dict):
-        return False, "Expected JSON object envelope"
-    items = payload.get("items")
-    if not isinstance(items, list):
-        return False, "Missing items array"
-    required_keys = {"alias_raw", "alias_normalized", "entity_id", "entity_type", "alias_kind", "source"}
-    for idx, item in enumerate(items[:100]):
-        if not isinstance(item, dict):
-            return False, f"Item {idx} is not an object"
-        missing = sorted(required_keys - set(item.keys()))
-        if missing:
-            return False, f"Item {idx} missing keys: {', '.join(missing)}"
-    return True, "OK"
+    return _validate_sampled_items("data/derived/entity_aliases.json", _CHECK_ENTITY_ALIASES_ITEMS, 100)
 
 
 def validate_kg_edges_artifact() -> tuple[bool, str]:
-    payload, message = _load_json(REPO_ROOT / "data/derived/kg_edges.json")
-    if payload is None:
-        return False, message
-    if not isinstance(payload, dict):
-        return False, "Expected JSON object envelope"
-    items = payload.get("items")
-    if not isinstance(items, list):
-        return False, "Missing items array"
-    required_keys = {"edge_id", "subject_id", "predicate", "object_id", "stability", "evidence_refs"}
-    for idx, item in enumerate(items[:100]):
-        if not isinstance(item, dict):
-            return False, f"Item {idx} is not an object"
-        missing = sorted(required_keys - set(item.keys()))
-        if missing:
-            return False, f"Item {idx} missing keys: {', '.join(missing)}"
-        if not isinstance(item.get("evidence_refs"), list):
-            return False, f"Item {idx} evidence_refs must be a list"
-    return True, "OK"
+    return _validate_sampled_items("data/derived/kg_edges.json", _CHECK_KG_EDGES_ITEMS, 100)
 
 
 def validate_events_artifact() -> tuple[bool, str]:
-    payload, message = _load_json(REPO_ROOT / "data/derived/events.json")
-    if payload is None:
-        return False, message
-    if not isinstance(payload, dict):
-        return False, "Expected JSON object envelope"
-    items = payload.get("items")
-    if not isinstance(items, list):
-        return False, "Missing items array"
-    required_keys = {
-        "event_id",
-        "scene_id",
-        "event_type_l1",
-        "event_type_l2",
-        "summary",
-        "participants",
-        "evidence_refs",
-        "sequence_in_scene",
-        "confidence",
-        "extraction_method",
-    }
-    for idx, item in enumerate(items[:120]):
-        if not isinstance(item, dict):
-            return False, f"Item {idx} is not an object"
-        missing = sorted(required_keys - set(item.keys()))
-        if missing:
-            return False, f"Item {idx} missing keys: {', '.join(missing)}"
-        if not isinstance(item.get("participants"), list):
-            return False, f"Item {idx} participants must be a list"
-        if not isinstance(item.get("evidence_refs"), list):
-            return False, f"Item {idx} evidence_refs must be a list"
-    return True, "OK"
+    return _validate_sampled_items("data/derived/events.json", _CHECK_EVENTS_ITEMS, 120)
 
 
 def validate_event_participants_artifact() -> tuple[bool, str]:
-    payload, message = _load_json(REPO_ROOT / "data/derived/event_participants.json")
-    if payload is None:
-        return False, message
-    if not isinstance(payload, dict):
-        return False, "Expected JSON object envelope"
-    items = payload.get("items")
-    if not isinstance(items, list):
-        return False, "Missing items array"
-    required_keys = {
-        "event_participant_id",
-        "event_id",
-        "scene_id",
-        "entity_id",
-        "role",
-        "participant_index",
-        "evidence_refs",
-    }
-    for idx, item in enumerate(items[:120]):
-        if not isinstance(item, dict):
-            return False, f"Item {idx} is not an object"
-        missing = sorted(required_keys - set(item.keys()))
-        if missing:
-            return False, f"Item {idx} missing keys: {', '.join(missing)}"
-        if not isinstance(item.get("evidence_refs"), list):
-            return False, f"Item {idx} evidence_refs must be a list"
-    return True, "OK"
+    return _validate_sampled_items("data/derived/event_participants.json", _CHECK_EVENT_PARTICIPANTS_ITEMS, 120)
 
 
 def validate_scene_index_artifact() -> tuple[bool, str]:
-    payload, message = _load_json(REPO_ROOT / "data/derived/scene_index.json")
-    if payload is None:
-        return False, message
-    if not isinstance(payload, dict):
-        return False, "Expected JSON object envelope"
-    items = payload.get("items")
-    if not isinstance(items, list):
-        return False, "Missing items array"
-    required_keys = {"scene_id", "scene_index", "event_ids", "event_count", "event_refs"}
-    for idx, item in enumerate(items[:80]):
-        if not isinstance(item, dict):
-            return False, f"Item {idx} is not an object"
-        missing = sorted(required_keys - set(item.keys()))
-        if missing:
-            return False, f"Item {idx} missing keys: {', '.join(missing)}"
-        if not isinstance(item.get("event_ids"), list):
-            return False, f"Item {idx} event_ids must be a list"
-        if not isinstance(item.get("event_refs"), list):
-            return False, f"Item {idx} event_refs must be a list"
-    return True, "OK"
+    return _validate_sampled_items("data/derived/scene_index.json", _CHECK_SCENE_INDEX_ITEMS, 80)
 
 
-def validate_taxonomy_coverage_report() -> tuple[bool, str]:
+@functools.lru_cache(maxsize=1)
+def _taxonomy_coverage_findings() -> tuple[tuple[bool, str], tuple[bool, str]]:
+    """One pass over taxonomy_coverage_report.json serving both of its validators.
+
+    Returns the (structural, phase-8 release gate) results together so the file
+    is inspected once even when both phases are in scope.
+    """
     payload, message = _load_json(REPO_ROOT / "data/eval/taxonomy_coverage_report.json")
     if payload is None:
-        return False, message
+        return (False, message), (False, message)
     if not isinstance(payload, dict):
-        return False, "Expected JSON object"
+        return (False, "Expected JSON object"), (False, "Expected JSON object")
+
     metadata = payload.get("metadata")
     summary = payload.get("summary")
+
+    structural: tuple[bool, str] = (True, "OK")
     if not isinstance(metadata, dict):
-        return False, "Missing/invalid metadata"
+        structural = (False, "Missing/invalid metadata")
+    elif not isinstance(summary, dict):
+        structural = (False, "Missing/invalid summary")
+    else:
+        for key in TAXONOMY_SUMMARY_KEYS:
+            if key not in summary:
+                structural = (False, f"Missing summary key: {key}")
+                break
+
     if not isinstance(summary, dict):
-        return False, "Missing/invalid summary"
-    for key in ["total_events", "unknown_event_type_count", "unmapped_review_required_count"]:
-        if key not in summary:
-            return False, f"Missing summary key: {key}"
-    return True, "OK"
+        gate: tuple[bool, str] = (False, "Missing/invalid summary")
+    else:
+        unmapped = summary.get("unmapped_review_required_count")
+        unknown = summary.get("unknown_event_type_count")
+        if unmapped != 0:
+            gate = (False, f"unmapped_review_required_count must be 0 (got {unmapped})")
+        elif unknown != 0:
+            gate = (False, f"unknown_event_type_count must be 0 (got {unknown})")
+        else:
+            gate = (True, "OK")
+
+    return structural, gate
+
+
+def validate_taxonomy_coverage_report() -> tuple[bool, str]:
+    return _taxonomy_coverage_findings()[0]
 
 
 def validate_unmapped_review_report() -> tuple[bool, str]:
@@ -425,60 +671,11 @@ def validate_unmapped_review_report() -> tuple[bool, str]:
 
 
 def validate_temporal_edges_artifact() -> tuple[bool, str]:
-    payload, message = _load_json(REPO_ROOT / "data/derived/temporal_edges.json")
-    if payload is None:
-        return False, message
-    if not isinstance(payload, dict):
-        return False, "Expected JSON object envelope"
-    items = payload.get("items")
-    if not isinstance(items, list):
-        return False, "Missing items array"
-    required_keys = {"temporal_edge_id", "from_event_id", "to_event_id", "relation", "basis"}
-    for idx, item in enumerate(items[:200]):
-        if not isinstance(item, dict):
-            return False, f"Item {idx} is not an object"
-        missing = sorted(required_keys - set(item.keys()))
-        if missing:
-            return False, f"Item {idx} missing keys: {', '.join(missing)}"
-    return True, "OK"
+    return _validate_sampled_items("data/derived/temporal_edges.json", _CHECK_TEMPORAL_EDGES_ITEMS, 200)
 
 
 def validate_state_changes_artifact() -> tuple[bool, str]:
-    payload, message = _load_json(REPO_ROOT / "data/derived/state_changes.json")
-    if payload is None:
-        return False, message
-    if not isinstance(payload, dict):
-        return False, "Expected JSON object envelope"
-    items = payload.get("items")
-    if not isinstance(items, list):
-        return False, "Missing items array"
-    required_keys = {
-        "state_change_id",
-        "subject_id",
-        "object_id",
-        "state_dimension",
-        "direction",
-        "scene_id",
-        "trigger_event_ids",
-        "evidence_refs",
-        "confidence",
-        "inference_method",
-        "claim_type",
-    }
-    for idx, item in enumerate(items[:200]):
-        if not isinstance(item, dict):
-            return False, f"Item {idx} is not an object"
-        missing = sorted(required_keys - set(item.keys()))
-        if missing:
-            return False, f"Item {idx} missing keys: {', '.join(missing)}"
-        if not isinstance(item.get("trigger_event_ids"), list):
-            return False, f"Item {idx} trigger_event_ids must be a list"
-        if not isinstance(item.get("evidence_refs"), list):
-            return False, f"Item {idx} evidence_refs must be a list"
-        claim_type = item.get("claim_type")
-        if claim_type not in {"explicit", "inferred"}:
-            return False, f"Item {idx} invalid claim_type: {claim_type}"
-    return True, "OK"
+    return _validate_sampled_items("data/derived/state_changes.json", _CHECK_STATE_CHANGES_ITEMS, 200)
 
 
 def validate_state_change_rules_config() -> tuple[bool, str]:
@@ -498,52 +695,50 @@ def validate_state_change_rules_config() -> tuple[bool, str]:
     sample_rule = rules[0] if rules else None
     if not isinstance(sample_rule, dict):
         return False, "rules[0] must be an object"
-    for key in ["rule_id", "subject_id", "object_id", "state_dimension", "direction", "claim_type"]:
+    for key in STATE_CHANGE_RULE_KEYS:
         if key not in sample_rule:
             return False, f"rules[0] missing key: {key}"
     return True, "OK"
 
 
 def validate_query_examples_artifact() -> tuple[bool, str]:
-    payload, message = _load_json(REPO_ROOT / "data/derived/query_examples.json")
-    if payload is None:
+    envelope, message = _load_envelope(REPO_ROOT / "data/derived/query_examples.json", sample=200)
+    if envelope is None:
         return False, message
-    if not isinstance(payload, dict):
-        return False, "Expected JSON object envelope"
-    metadata = payload.get("metadata")
-    items = payload.get("items")
-    if not isinstance(metadata, dict):
+    metadata = envelope.metadata
+    items = envelope.items
+    if metadata is None:
         return False, "Missing/invalid metadata"
-    if not isinstance(items, list):
+    if items is None:
         return False, "Missing/invalid items list"
-    if len(items) < 10:
+    if envelope.item_count < 10:
         return False, "Must include at least 10 benchmark query fixtures"
-    required_keys = {"query_id", "question", "query_type_expected", "mode_expected"}
+    required_keys = QUERY_EXAMPLES_REQUIRED_KEYS
     query_types: set[str] = set()
-    for idx, item in enumerate(items[:200]):
-        if not isinstance(item, dict):
+    for idx, item in enumerate(items):
+        if type(item) is not dict:
             return False, f"Item {idx} is not an object"
-        missing = sorted(required_keys - set(item.keys()))
-        if missing:
+        if not item.keys() >= required_keys:
+            missing = sorted(required_keys - item.keys())
             return False, f"Item {idx} missing keys: {', '.join(missing)}"
         q = item.get("question")
-        if not isinstance(q, str) or not q.strip():
+        if type(q) is not str or not q.strip():
             return False, f"Item {idx} has invalid question"
         query_type = item.get("query_type_expected")
         mode = item.get("mode_expected")
-        if not isinstance(query_type, str):
+        if type(query_type) is not str:
             return False, f"Item {idx} has invalid query_type_expected"
-        if query_type not in {"fact", "timeline", "state_change", "causal_chain", "evidence", "comparison"}:
+        if query_type not in VALID_QUERY_TYPES:
             return False, f"Item {idx} unknown query_type_expected: {query_type}"
-        if not isinstance(mode, str) or mode not in {"kg", "ntg", "hybrid", "baseline_rag"}:
+        if type(mode) is not str or mode not in VALID_MODES:
             return False, f"Item {idx} invalid mode_expected: {mode}"
         query_types.add(query_type)
-    missing_query_types = sorted({"fact", "timeline", "state_change", "causal_chain", "evidence", "comparison"} - query_types)
+    missing_query_types = sorted(VALID_QUERY_TYPES - query_types)
     if missing_query_types:
         return False, f"Missing query fixture coverage for: {', '.join(missing_query_types)}"
     record_count = metadata.get("record_count")
-    if isinstance(record_count, int) and record_count != len(items):
-        return False, f"metadata.record_count ({record_count}) != len(items) ({len(items)})"
+    if isinstance(record_count, int) and record_count != envelope.item_count:
+        return False, f"metadata.record_count ({record_count}) != len(items) ({envelope.item_count})"
     return True, "OK"
 
 
@@ -563,15 +758,7 @@ def validate_parser_quality_report() -> tuple[bool, str]:
         return False, "metadata.artifact_type must be parser_quality_report"
     if not isinstance(summary, dict):
         return False, "Missing/invalid summary"
-    required_summary_keys = [
-        "release_gate_passed",
-        "total_checks",
-        "passed_checks",
-        "failed_checks",
-        "explicit_scene_header_count_target",
-        "explicit_scene_header_count_actual",
-    ]
-    for key in required_summary_keys:
+    for key in PARSER_QUALITY_SUMMARY_KEYS:
         if key not in summary:
             return False, f"Missing summary key: {key}"
     if summary.get("failed_checks") != 0:
@@ -591,40 +778,99 @@ def validate_parser_quality_report() -> tuple[bool, str]:
 
 
 def validate_taxonomy_coverage_release_gate_phase8() -> tuple[bool, str]:
-    payload, message = _load_json(REPO_ROOT / "data/eval/taxonomy_coverage_report.json")
-    if payload is None:
-        return False, message
+    return _taxonomy_coverage_findings()[1]
+
+
+# Sidecar for the README section scan, keyed on (mtime_ns, size) so unchanged
+# READMEs short-circuit across runs; lives next to the other pipeline caches.
+_README_CACHE_PATH = REPO_ROOT / "data" / "cache" / "validate_artifacts" / "readme_check.json"
+
+
+def _read_readme_cache(st: os.stat_result) -> tuple[bool, str] | None:
+    try:
+        payload = json.loads(_README_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return None
     if not isinstance(payload, dict):
-        return False, "Expected JSON object"
-    summary = payload.get("summary")
-    if not isinstance(summary, dict):
-        return False, "Missing/invalid summary"
-    unmapped = summary.get("unmapped_review_required_count")
-    unknown = summary.get("unknown_event_type_count")
-    if unmapped != 0:
-        return False, f"unmapped_review_required_count must be 0 (got {unmapped})"
-    if unknown != 0:
-        return False, f"unknown_event_type_count must be 0 (got {unknown})"
-    return True, "OK"
+        return None
+    if payload.get("mtime_ns") != st.st_mtime_ns or payload.get("size") != st.st_size:
+        return None
+    ok = payload.get("ok")
+    message = payload.get("message")
+    if not isinstance(ok, bool) or not isinstance(message, str):
+        return None
+    return ok, message
+
+
+def _write_readme_cache(st: os.stat_result, ok: bool, message: str) -> None:
+    # Best-effort: a read-only tree just means the scan reruns next time.
+    try:
+        _README_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _README_CACHE_PATH.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "ok": ok, "message": message}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, _README_CACHE_PATH)
+    except OSError:
+        pass
 
 
 def validate_phase8_docs_readme() -> tuple[bool, str]:
     readme_path = REPO_ROOT / "README.md"
+    try:
+        st = os.stat(readme_path)
+    except FileNotFoundError:
+        return False, "Missing file"
+    except OSError as exc:
+        return False, str(exc)
+    cached = _read_readme_cache(st)
+    if cached is not None:
+        return cached
     try:
         text = readme_path.read_text(encoding="utf-8")
     except FileNotFoundError:
         return False, "Missing file"
     except OSError as exc:
         return False, str(exc)
-    required_snippets = [
-        "## What It Demonstrates",
-        "## Setup",
-        "## Local-Only Disclaimer",
-    ]
-    missing = [snippet for snippet in required_snippets if snippet not in text]
+    missing = [snippet for snippet in README_REQUIRED_SECTIONS if snippet not in text]
     if missing:
-        return False, f"README.md missing required sections: {', '.join(missing)}"
-    return True, "OK"
+        ok, message = False, f"README.md missing required sections: {', '.join(missing)}"
+    else:
+        ok, message = True, "OK"
+    _write_readme_cache(st, ok, message)
+    return ok, message
+
+
+# Specialized content validators keyed by the phase that introduces them.
+PHASE_SPECIALIZED: dict[int, tuple[tuple[str, Callable[[], tuple[bool, str]]], ...]] = {
+    1: (
+        ("data/intermediate/parser_build_manifest.json", validate_parser_manifest),
+    ),
+    3: (
+        ("data/derived/events.json", validate_events_artifact),
+        ("data/derived/event_participants.json", validate_event_participants_artifact),
+        ("data/derived/scene_index.json", validate_scene_index_artifact),
+        ("data/eval/taxonomy_coverage_report.json", validate_taxonomy_coverage_report),
+        ("data/eval/unmapped_events_review.json", validate_unmapped_review_report),
+        ("data/derived/entities.json", validate_entities_artifact),
+        ("data/derived/entity_aliases.json", validate_entity_aliases_artifact),
+        ("data/derived/kg_edges.json", validate_kg_edges_artifact),
+    ),
+    4: (
+        ("config/state_change_rules.json", validate_state_change_rules_config),
+        ("data/derived/temporal_edges.json", validate_temporal_edges_artifact),
+        ("data/derived/state_changes.json", validate_state_changes_artifact),
+    ),
+    5: (
+        ("data/derived/query_examples.json", validate_query_examples_artifact),
+    ),
+    8: (
+        ("data/eval/parser_quality_report.json", validate_parser_quality_report),
+        ("data/eval/taxonomy_coverage_report.json", validate_taxonomy_coverage_release_gate_phase8),
+        ("README.md", validate_phase8_docs_readme),
+    ),
+}
 
 
 def main() -> int:
@@ -633,141 +879,53 @@ def main() -> int:
         print("error: --phase must be between 0 and 8")
         return 2
 
-    scaffold_required, _ = partition(SCAFFOLD_REQUIREMENTS, args.phase)
-    generated_required, generated_later = partition(GENERATED_PHASE_OUTPUTS, args.phase)
+    scaffold_required, generated_required, generated_later = requirements_for_phase(args.phase)
 
-    missing_required: list[str] = []
+    missing_required: list[str] = []  # ordered, as reported
+    missing_paths: set[str] = set()  # O(1) membership for the phase branches
     present_required = 0
     validation_errors: list[str] = []
-
-    for req in scaffold_required + generated_required:
-        if exists(req):
+    # Content checks gathered across the phase branches, then run in parallel:
+    # each one reads and parses a different file, so the I/O overlaps.
+    checks: list[tuple[str, Callable[[], tuple[bool, str]]]] = []
+
+    # I/O pass: classify every path — required and later-phase — as present or
+    # missing before any content validation touches file contents.
+    for path, present in bulk_exists(scaffold_required + generated_required).items():
+        if present:
             present_required += 1
         else:
-            missing_required.append(req.path)
+            missing_required.append(path)
+            missing_paths.add(path)
+    later_presence = bulk_exists(generated_later)
 
+    # Compute pass: parse and validate only what the I/O pass found present.
     schema_ok, schema_message = validate_schema_versions()
-    if args.phase >= 0 and not schema_ok and "data/derived/schema_versions.json" not in missing_required:
+    if args.phase >= 0 and not schema_ok and "data/derived/schema_versions.json" not in missing_paths:
         missing_required.append(f"data/derived/schema_versions.json ({schema_message})")
 
-    if args.phase >= 1:
-        for rel_path in PHASE1_ENVELOPE_PATHS:
-            if rel_path in missing_required:
-                continue
-            if exists(Requirement(rel_path)):
-                ok, msg = validate_envelope_json(rel_path)
-                if not ok:
-                    validation_errors.append(f"{rel_path}: {msg}")
-        manifest_path = "data/intermediate/parser_build_manifest.json"
-        if manifest_path not in missing_required and exists(Requirement(manifest_path)):
-            ok, msg = validate_parser_manifest()
-            if not ok:
-                validation_errors.append(f"{manifest_path}: {msg}")
-
-    if args.phase >= 2:
-        for rel_path in PHASE2_ENVELOPE_PATHS:
-            if rel_path in missing_required:
-                continue
-            if exists(Requirement(rel_path)):
-                ok, msg = validate_envelope_json(rel_path)
-                if not ok:
-                    validation_errors.append(f"{rel_path}: {msg}")
-
-    if args.phase >= 3:
-        for rel_path in PHASE3_ENVELOPE_PATHS:
-            if rel_path in missing_required:
-                continue
-            if exists(Requirement(rel_path)):
-                ok, msg = validate_envelope_json(rel_path)
-                if not ok:
-                    validation_errors.append(f"{rel_path}: {msg}")
-
-        specialized_phase3 = [
-            ("data/derived/events.json", validate_events_artifact),
-            ("data/derived/event_participants.json", validate_event_participants_artifact),
-            ("data/derived/scene_index.json", validate_scene_index_artifact),
-            ("data/eval/taxonomy_coverage_report.json", validate_taxonomy_coverage_report),
-            ("data/eval/unmapped_events_review.json", validate_unmapped_review_report),
-        ]
-        for rel_path, fn in specialized_phase3:
-            if rel_path in missing_required:
-                continue
-            if exists(Requirement(rel_path)):
-                ok, msg = fn()
-                if not ok:
-                    validation_errors.append(f"{rel_path}: {msg}")
-
-        specialized_checks = [
-            ("data/derived/entities.json", validate_entities_artifact),
-            ("data/derived/entity_aliases.json", validate_entity_aliases_artifact),
-            ("data/derived/kg_edges.json", validate_kg_edges_artifact),
-        ]
-        for rel_path, fn in specialized_checks:
-            if rel_path in missing_required:
-                continue
-            if exists(Requirement(rel_path)):
-                ok, msg = fn()
-                if not ok:
-                    validation_errors.append(f"{rel_path}: {msg}")
-
-    if args.phase >= 4:
-        for rel_path in PHASE4_ENVELOPE_PATHS:
-            if rel_path in missing_required:
-                continue
-            if exists(Requirement(rel_path)):
-                ok, msg = validate_envelope_json(rel_path)
+    # EAFP: no presence pre-check here. Every path below is also a requirement,
+    # so a missing file was already recorded above; the validators themselves
+    # turn a vanished file into a "Missing file" error rather than hiding it.
+    for phase in range(1, args.phase + 1):
+        for rel_path in PHASE_ENVELOPES.get(phase, ()):
+            if rel_path not in missing_paths:
+                checks.append((rel_path, functools.partial(validate_envelope_json, rel_path)))
+        for rel_path, fn in PHASE_SPECIALIZED.get(phase, ()):
+            if rel_path not in missing_paths:
+                checks.append((rel_path, fn))
+
+    if checks:
+        # Results are consumed in submission order so the report stays
+        # deterministic regardless of which file finishes parsing first.
+        with ThreadPoolExecutor(max_workers=min(len(checks), os.cpu_count() or 4)) as executor:
+            outcomes = executor.map(lambda check: check[1](), checks)
+            for (rel_path, _fn), (ok, msg) in zip(checks, outcomes):
                 if not ok:
                     validation_errors.append(f"{rel_path}: {msg}")
 
-        specialized_phase4 = [
-            ("config/state_change_rules.json", validate_state_change_rules_config),
-            ("data/derived/temporal_edges.json", validate_temporal_edges_artifact),
-            ("data/derived/state_changes.json", validate_state_changes_artifact),
-        ]
-        for rel_path, fn in specialized_phase4:
-            if rel_path in missing_required:
-                continue
-            if exists(Requirement(rel_path)):
-                ok, msg = fn()
-                if not ok:
-                    validation_errors.append(f"{rel_path}: {msg}")
-
-    if args.phase >= 5:
-        for rel_path in PHASE5_ENVELOPE_PATHS:
-            if rel_path in missing_required:
-                continue
-            if exists(Requirement(rel_path)):
-                ok, msg = validate_envelope_json(rel_path)
-                if not ok:
-                    validation_errors.append(f"{rel_path}: {msg}")
-
-        specialized_phase5 = [
-            ("data/derived/query_examples.json", validate_query_examples_artifact),
-        ]
-        for rel_path, fn in specialized_phase5:
-            if rel_path in missing_required:
-                continue
-            if exists(Requirement(rel_path)):
-                ok, msg = fn()
-                if not ok:
-                    validation_errors.append(f"{rel_path}: {msg}")
-
-    if args.phase >= 8:
-        specialized_phase8 = [
-            ("data/eval/parser_quality_report.json", validate_parser_quality_report),
-            ("data/eval/taxonomy_coverage_report.json", validate_taxonomy_coverage_release_gate_phase8),
-            ("README.md", validate_phase8_docs_readme),
-        ]
-        for rel_path, fn in specialized_phase8:
-            if rel_path in missing_required:
-                continue
-            if exists(Requirement(rel_path)):
-                ok, msg = fn()
-                if not ok:
-                    validation_errors.append(f"{rel_path}: {msg}")
-
-    pending_later = [req.path for req in generated_later if not exists(req)]
-    available_early = [req.path for req in generated_later if exists(req)]
+    pending_later = [path for path, present in later_presence.items() if not present]
+    available_early = [path for path, present in later_presence.items() if present]
 
     result = {
         "phase": args.phase,
@@ -782,32 +940,36 @@ def main() -> int:
     }
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        if orjson is not None:
+            print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+        else:
+            print(json.dumps(result, indent=2))
     else:
-        print(f"Artifact validation report (phase {args.phase})")
-        print(f"Repo root: {REPO_ROOT}")
-        print(f"Required present: {present_required}/{result['required_checked']}")
-        print(f"schema_versions.json: {schema_message}")
+        # Assemble the report and emit it with one write instead of one
+        # syscall per line.
+        lines = [
+            f"Artifact validation report (phase {args.phase})",
+            f"Repo root: {REPO_ROOT}",
+            f"Required present: {present_required}/{result['required_checked']}",
+            f"schema_versions.json: {schema_message}",
+        ]
         if validation_errors:
-            print("Validation errors:")
-            for err in validation_errors:
-                print(f"  - {err}")
+            lines.append("Validation errors:")
+            lines.extend(f"  - {err}" for err in validation_errors)
         else:
-            print("Validation errors: none")
+            lines.append("Validation errors: none")
         if missing_required:
-            print("Missing required artifacts:")
-            for path in missing_required:
-                print(f"  - {path}")
+            lines.append("Missing required artifacts:")
+            lines.extend(f"  - {path}" for path in missing_required)
         else:
-            print("Missing required artifacts: none")
+            lines.append("Missing required artifacts: none")
         if pending_later:
-            print("Pending later-phase artifacts (informational):")
-            for path in pending_later:
-                print(f"  - {path}")
+            lines.append("Pending later-phase artifacts (informational):")
+            lines.extend(f"  - {path}" for path in pending_later)
         if available_early:
-            print("Later-phase artifacts already present (informational):")
-            for path in available_early:
-                print(f"  - {path}")
+            lines.append("Later-phase artifacts already present (informational):")
+            lines.extend(f"  - {path}" for path in available_early)
+        print("\n".join(lines))
 
     return 0 if not missing_required and not validation_errors else 1
 